@@ -1,12 +1,134 @@
 """Producer Pal API client."""
 
-from typing import List
+import functools
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 import requests
+from pydantic import BaseModel, ValidationError
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.util import Retry
 
 from api_layer.models import Clip, Note, Track
 
+# JSON codec: both branches bind these with the same signatures
+_json_dumps: Callable[[Any], bytes]
+_json_loads: Callable[[Union[bytes, str]], Any]
+
+try:
+    # Optional C-accelerated codec; works on UTF-8 bytes without a str round trip
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    import json
+
+    def _stdlib_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_dumps = _stdlib_dumps
+    _json_loads = json.loads
+
+_T = TypeVar("_T")
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Upper bound on in-flight requests; matches the session's connection pool size
+_MAX_CONCURRENT_CALLS = 16
+
+# Retry transient failures on the pooled connections. Read errors are not
+# retried (the server may already have applied a tool call such as
+# ppal-create-clip); after the last attempt the final response is returned so
+# raise_for_status still raises requests.HTTPError.
+_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.1,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False,
+)
+
+# Headers every MCP request needs; Producer Pal answers with SSE only when the
+# client advertises text/event-stream
+_MCP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+# One keep-alive session per base URL, shared by every client in the process
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Responses longer than this are not memoized, so a stream of large unique
+# payloads cannot pin megabytes of text in the parse cache
+_JS_CACHE_MAX_TEXT = 64_000
+
+# One token of a JavaScript object literal that matters for key quoting:
+# either a complete string literal (unrolled-loop form, so escaped quotes stay
+# inside it) or an unquoted key that directly follows "{" or "," and precedes ":".
+_JS_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|(?<=[{,])(\s*)(\w+)(?=\s*:)')
+
+
+def _is_batch_rejection(by_id: Dict[Any, Any]) -> bool:
+    """Whether a batch reply is the server refusing batches outright.
+
+    Per JSON-RPC 2.0, a batch the server cannot accept is answered with a
+    single Invalid Request error (-32600) whose id is null.
+    """
+    if len(by_id) != 1 or None not in by_id:
+        return False
+    error = by_id[None].get("error")
+    return isinstance(error, dict) and error.get("code") == -32600
+
+
+def _make_session() -> requests.Session:
+    """Create a pooled, retrying session with the MCP request headers."""
+    session = requests.Session()
+    session.headers.update(_MCP_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=_MAX_CONCURRENT_CALLS, max_retries=_RETRY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _quote_js_key(match: re.Match[str]) -> str:
+    # Runs once per key and string literal: one groups() call, no branches
+    # beyond the string-literal check (a string literal is copied verbatim)
+    space, key = match.groups()
+    return match[0] if key is None else f'{space}"{key}"'
+
+
+def _quote_js_keys(js_text: str) -> str:
+    """Quote the unquoted object keys of a JavaScript object literal.
+
+    Single forward pass over the text: string literals are consumed as whole
+    tokens, so text inside string values (e.g. "note:C3") is never rewritten,
+    and keys that are already quoted pass through unchanged.
+
+    Args:
+        js_text: JavaScript object notation, e.g. '{id:"1",name:"Bass"}'.
+
+    Returns:
+        The same text with keys quoted, e.g. '{"id":"1","name":"Bass"}'.
+    """
+    return _JS_TOKEN_RE.sub(_quote_js_key, js_text)
+
+
+@functools.lru_cache(maxsize=256)
+def _quote_js_keys_cached(js_text: str) -> str:
+    """Memoized _quote_js_keys for repeated identical responses.
+
+    Caches the quoted JSON text rather than the decoded dict, so every caller
+    still gets a fresh, independently mutable object when it is decoded.
+    """
+    return _quote_js_keys(js_text)
+
 
 class ProducerPalClient:
     """Client for interacting with Producer Pal API.
@@ -35,33 +157,231 @@ class ProducerPalClient:
     - Decision rationale: docs/ARCHITECTURE.md#why-manual-parsing
     """
 
-    def __init__(self, base_url: str = "http://localhost:3350") -> None:
+    __slots__ = ("base_url", "_url", "_session", "_batch_supported")
+
+    # JSON-RPC fields shared by every tools/call request; only params vary
+    _ENVELOPE = {"jsonrpc": "2.0", "method": "tools/call", "id": 1}
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3350",
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """Initialize Producer Pal client.
 
         Args:
             base_url: Base URL of the Producer Pal API server.
                 Defaults to "http://localhost:3350".
+            session: Optional caller-owned session to send requests on. It is
+                not modified (the MCP headers go out with each request), never
+                shared with other clients, and never closed by close_all().
+                Defaults to the shared session for base_url.
         """
         self.base_url = base_url.rstrip("/")
+        self._url = f"{self.base_url}/mcp"
+
+        if session is None:
+            # Persistent session: keep-alive reuses TCP connections across
+            # tool calls, and across all clients talking to the same server
+            with _SESSIONS_LOCK:
+                session = _SESSIONS.get(self.base_url)
+                if session is None:
+                    session = _SESSIONS[self.base_url] = _make_session()
+        self._session = session
+
+        # Whether the server accepts JSON-RPC batches; None until first probed
+        self._batch_supported: Optional[bool] = None
+
+    def close(self) -> None:
+        """Release this client.
+
+        No-op: the HTTP session is shared by every client with the same
+        base_url and stays open for reuse. Use close_all() to release it.
+        A session passed to the constructor is closed by its owner.
+        """
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every shared HTTP session (e.g. for test teardown)."""
+        with _SESSIONS_LOCK:
+            sessions = list(_SESSIONS.values())
+            _SESSIONS.clear()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "ProducerPalClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _parse_sse(self, sse_body: bytes) -> dict:
+        """Parse Server-Sent Events format from the raw response body.
+
+        Decodes the first "data: " field, located with bytes.find so the body
+        is never split into a list of lines.
+        """
+        if sse_body.startswith(b"data: "):
+            start = 6
+        else:
+            start = sse_body.find(b"\ndata: ")
+            if start < 0:
+                raise ValueError("No data in SSE response")
+            start += 7
+        end = sse_body.find(b"\n", start)
+        return _json_loads(sse_body[start:end] if end >= 0 else sse_body[start:])
+
+    def _parse_sse_messages(self, sse_body: bytes) -> List[Any]:
+        """Decode every "data: " field of an SSE body into a flat message list.
+
+        A server may answer a JSON-RPC batch with one event per response, or
+        with a single event carrying the whole array; both come out flat.
+        """
+        if sse_body.startswith(b"data: "):
+            start = 6
+        else:
+            start = sse_body.find(b"\ndata: ")
+            start = start + 7 if start >= 0 else -1
+
+        messages: List[Any] = []
+        while start >= 0:
+            end = sse_body.find(b"\n", start)
+            if end < 0:
+                end = len(sse_body)
+            frame = _json_loads(sse_body[start:end])
+            if isinstance(frame, list):
+                messages.extend(frame)
+            else:
+                messages.append(frame)
+            start = sse_body.find(b"\ndata: ", end)
+            if start >= 0:
+                start += 7
 
-    def _parse_sse(self, sse_text: str) -> dict:
-        """Parse Server-Sent Events format."""
-        import json
+        if not messages:
+            raise ValueError("No data in SSE response")
+        return messages
 
-        lines = sse_text.strip().split("\n")
-        for line in lines:
-            if line.startswith("data: "):
-                return json.loads(line[6:])
-        raise ValueError("No data in SSE response")
+    def _js_to_json(self, js_text: str) -> str:
+        """Quote JS object keys, memoizing texts up to _JS_CACHE_MAX_TEXT."""
+        if len(js_text) > _JS_CACHE_MAX_TEXT:
+            return _quote_js_keys(js_text)
+        return _quote_js_keys_cached(js_text)
 
     def _parse_js_object(self, js_text: str) -> dict:
         """Convert JavaScript object notation to proper JSON."""
-        import json
-        import re
+        # Fast path: already valid JSON (first key quoted), no rewrite needed
+        if js_text.lstrip().startswith('{"'):
+            try:
+                return _json_loads(js_text)
+            except ValueError:
+                pass  # mixed notation, fall through to key quoting
 
         # Add quotes to unquoted keys: {id:"1"} → {"id":"1"}
-        json_text = re.sub(r"(\w+):", r'"\1":', js_text)
-        return json.loads(json_text)
+        return _json_loads(self._js_to_json(js_text))
+
+    def _validate_js_object(self, js_text: str, model: Type[_ModelT]) -> _ModelT:
+        """Decode JavaScript object notation straight into a pydantic model.
+
+        Same fast path and key quoting as _parse_js_object, but the JSON text
+        goes to model_validate_json, so pydantic-core builds the model while
+        parsing instead of walking an intermediate dict.
+        """
+        if js_text.lstrip().startswith('{"'):
+            try:
+                return model.model_validate_json(js_text)
+            except ValidationError as e:
+                if e.errors()[0]["type"] != "json_invalid":
+                    raise  # valid JSON, invalid data
+        return model.model_validate_json(self._js_to_json(js_text))
+
+    def _post(self, payload: Union[dict, list]) -> Any:
+        """POST a JSON-RPC payload to the MCP endpoint and decode the body.
+
+        Args:
+            payload: A single JSON-RPC request object or a batch (list) of them.
+
+        Returns:
+            The decoded JSON-RPC response (Layer 1 applied). For a batch
+            answered over SSE, the messages of all events as one flat list.
+
+        Raises:
+            ConnectionError: If connection to the API server fails.
+            requests.RequestException: For other HTTP-related errors.
+        """
+        try:
+            # Body is encoded here (orjson when available). The MCP headers are
+            # sent per request: an injected session carries requests' default
+            # "Accept: */*", which must not win over text/event-stream
+            body = _json_dumps(payload)
+            response = self._session.post(
+                self._url, data=body, headers=_MCP_HEADERS, timeout=30
+            )
+        except RequestsConnectionError as e:
+            raise ConnectionError(
+                f"Failed to connect to Producer Pal API at {self.base_url}: {e}"
+            ) from e
+        response.raise_for_status()
+
+        # Decoders work on the raw UTF-8 bytes; only transcode (via .text) when
+        # the server explicitly declares another charset. response.encoding is
+        # not used here: requests defaults any text/* type to ISO-8859-1.
+        content_type = response.headers.get("Content-Type", "")
+        body = response.content
+        charset = content_type.partition("charset=")[2].split(";")[0].strip(' "')
+        if charset and charset.lower() not in ("utf-8", "utf8"):
+            body = response.text.encode()
+
+        # Layer 1: Parse SSE
+        if "text/event-stream" in content_type:
+            if isinstance(payload, list):
+                return self._parse_sse_messages(body)
+            return self._parse_sse(body)
+        return _json_loads(body)
+
+    def _extract_content(self, json_rpc_response: Any) -> Union[str, dict]:
+        """Unwrap one JSON-RPC response down to the MCP text content (Layer 2).
+
+        Returns:
+            The JS-notation text of the first text content block, or the raw
+            result dict when the response carries no text content.
+
+        Raises:
+            ValueError: If the JSON-RPC response contains an error object.
+        """
+        # Check for error
+        if isinstance(json_rpc_response, dict) and json_rpc_response.get("error"):
+            raise ValueError(f"JSON-RPC error: {json_rpc_response['error']}")
+
+        # Layer 2: Extract MCP content
+        result = json_rpc_response.get("result", {}) if isinstance(json_rpc_response, dict) else {}
+        content = result.get("content", [])
+
+        if content and len(content) > 0 and content[0].get("type") == "text":
+            return content[0].get("text", "{}")
+
+        return result
+
+    def _extract_result(self, json_rpc_response: Any) -> dict:
+        """Unwrap one JSON-RPC response into the tool's result as a dict."""
+        content = self._extract_content(json_rpc_response)
+        if isinstance(content, str):
+            # Layer 3: Parse JS object
+            return self._parse_js_object(content)
+        return content
+
+    def _extract_model(self, json_rpc_response: Any, model: Type[_ModelT]) -> _ModelT:
+        """Unwrap one JSON-RPC response directly into a pydantic model."""
+        content = self._extract_content(json_rpc_response)
+        if isinstance(content, str):
+            # Layer 3: Parse JS object and validate in one pass
+            return self._validate_js_object(content, model)
+        return model.model_validate(content)
+
+    def _payload(self, tool_name: str, arguments: dict) -> dict:
+        """Build a tools/call JSON-RPC request from the shared envelope."""
+        payload = self._ENVELOPE.copy()
+        payload["params"] = {"name": tool_name, "arguments": arguments}
+        return payload
 
     def _call_tool(self, tool_name: str, arguments: dict) -> dict:
         """Call a Producer Pal tool with given arguments.
@@ -82,53 +402,95 @@ class ProducerPalClient:
             requests.RequestException: For other HTTP-related errors.
             ValueError: If the JSON-RPC response contains an error object.
         """
-        url = f"{self.base_url}/mcp"
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments,
-            },
-            "id": 1,
-        }
-        
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream",
-                },
-                timeout=30,
-            )
-            response.raise_for_status()
+        return self._extract_result(self._post(self._payload(tool_name, arguments)))
 
-            # Layer 1: Parse SSE
-            if "text/event-stream" in response.headers.get("Content-Type", ""):
-                json_rpc_response = self._parse_sse(response.text)
-            else:
-                json_rpc_response = response.json()
+    def _call_tool_typed(
+        self, tool_name: str, arguments: dict, model: Type[_ModelT]
+    ) -> _ModelT:
+        """Call a Producer Pal tool and validate its response into model.
 
-            # Check for error
-            if isinstance(json_rpc_response, dict) and json_rpc_response.get("error"):
-                raise ValueError(f"JSON-RPC error: {json_rpc_response['error']}")
+        Like _call_tool, but the tool's text content is decoded and validated
+        in a single model_validate_json pass.
 
-            # Layer 2: Extract MCP content
-            result = json_rpc_response.get("result", {}) if isinstance(json_rpc_response, dict) else {}
-            content = result.get("content", [])
+        Raises:
+            ConnectionError: If connection to the API server fails.
+            requests.RequestException: For other HTTP-related errors.
+            ValueError: If the JSON-RPC response contains an error object.
+            pydantic.ValidationError: If the response cannot be parsed into model.
+        """
+        json_rpc_response = self._post(self._payload(tool_name, arguments))
+        return self._extract_model(json_rpc_response, model)
 
-            if content and len(content) > 0 and content[0].get("type") == "text":
-                # Layer 3: Parse JS object
-                js_text = content[0].get("text", "{}")
-                return self._parse_js_object(js_text)
+    def _batch(
+        self, calls: List[Tuple[str, dict]], extract: Callable[[Any], _T]
+    ) -> List[_T]:
+        """Send calls as one JSON-RPC batch and extract each response in order.
 
-            return result
-        except RequestsConnectionError as e:
-            raise ConnectionError(
-                f"Failed to connect to Producer Pal API at {self.base_url}: {e}"
-            ) from e
+        Only an explicit rejection of the batch (a 4xx status, or a single
+        Invalid Request error with a null id) makes the client fall back to
+        one request per call, and remember to do so from then on. Calls whose
+        responses came back are never sent again; any call missing from an
+        otherwise valid reply is retried on its own.
+
+        Raises:
+            ValueError: If the reply to the batch cannot be matched to it.
+        """
+        if not calls:
+            return []
+
+        if self._batch_supported is False:
+            return [self._call_single(name, args, extract) for name, args in calls]
+
+        payload = [
+            {**self._payload(name, args), "id": i} for i, (name, args) in enumerate(calls)
+        ]
+        try:
+            reply = self._post(payload)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is None or not 400 <= status < 500:
+                raise  # the server may have processed part of the batch
+            reply = None
+
+        messages = reply if isinstance(reply, list) else [reply]
+        by_id = {m.get("id"): m for m in messages if isinstance(m, dict)}
+        if reply is None or _is_batch_rejection(by_id):
+            self._batch_supported = False
+            return [self._call_single(name, args, extract) for name, args in calls]
+        if not any(i in by_id for i in range(len(calls))):
+            raise ValueError(f"Unexpected reply to JSON-RPC batch: {reply!r}")
+
+        self._batch_supported = True
+        return [
+            extract(by_id[i]) if i in by_id else self._call_single(name, args, extract)
+            for i, (name, args) in enumerate(calls)
+        ]
+
+    def _call_single(
+        self, tool_name: str, arguments: dict, extract: Callable[[Any], _T]
+    ) -> _T:
+        """Send one tools/call request outside a batch and extract its response."""
+        return extract(self._post(self._payload(tool_name, arguments)))
+
+    def call_batch(self, calls: List[Tuple[str, dict]]) -> List[dict]:
+        """Call several Producer Pal tools in one JSON-RPC batch request.
+
+        All calls travel in a single HTTP round trip. If the server does not
+        accept batches, this transparently falls back to sequential calls.
+
+        Args:
+            calls: (tool_name, arguments) pairs, e.g.
+                [("ppal-read-clip", {"trackId": 1, "clipId": 0}), ...].
+
+        Returns:
+            List of tool responses in the same order as calls.
+
+        Raises:
+            ConnectionError: If connection to the API server fails.
+            requests.RequestException: For other HTTP-related errors.
+            ValueError: If any JSON-RPC response contains an error object.
+        """
+        return self._batch(calls, self._extract_result)
 
     def get_project_info(self) -> dict:
         """Get information about the current Live Set project.
@@ -161,8 +523,30 @@ class ProducerPalClient:
             requests.RequestException: For other HTTP-related errors.
             pydantic.ValidationError: If the response cannot be parsed into Track model.
         """
-        data = self._call_tool("ppal-read-track", {"trackId": track_id})
-        return Track.model_validate(data)
+        return self._call_tool_typed("ppal-read-track", {"trackId": track_id}, Track)
+
+    def get_tracks(self, track_ids: List[int]) -> List[Track]:
+        """Get information about several tracks concurrently.
+
+        Issues one ppal-read-track call per track from a thread pool, so the
+        round trips overlap on the shared session instead of running back-to-back.
+
+        Args:
+            track_ids: Identifiers of the tracks to retrieve.
+
+        Returns:
+            List of Track models in the same order as track_ids.
+
+        Raises:
+            ConnectionError: If connection to the API server fails.
+            requests.RequestException: For other HTTP-related errors.
+            pydantic.ValidationError: If a response cannot be parsed into Track model.
+        """
+        if not track_ids:
+            return []
+        workers = min(len(track_ids), _MAX_CONCURRENT_CALLS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_track, track_ids))
 
     def create_midi_clip(self, track_id: int, notes: List[Note]) -> Clip:
         """Create a new MIDI clip on the specified track.
@@ -183,10 +567,9 @@ class ProducerPalClient:
         """
         arguments = {
             "trackId": track_id,
-            "notes": [note.model_dump() for note in notes],
+            "notes": [note.dump_cached() for note in notes],
         }
-        data = self._call_tool("ppal-create-clip", arguments)
-        return Clip.model_validate(data)
+        return self._call_tool_typed("ppal-create-clip", arguments, Clip)
 
     def get_clip(self, track_id: int, clip_id: int) -> Clip:
         """Get information about a specific clip including its notes.
@@ -205,7 +588,29 @@ class ProducerPalClient:
             requests.RequestException: For other HTTP-related errors.
             pydantic.ValidationError: If the response cannot be parsed into Clip model.
         """
-        data = self._call_tool(
-            "ppal-read-clip", {"trackId": track_id, "clipId": clip_id}
+        return self._call_tool_typed(
+            "ppal-read-clip", {"trackId": track_id, "clipId": clip_id}, Clip
         )
-        return Clip.model_validate(data)
+
+    def get_clips(self, track_id: int, clip_ids: List[int]) -> List[Clip]:
+        """Get several clips from one track in a single round trip.
+
+        Sends the ppal-read-clip calls as one JSON-RPC batch (see call_batch).
+
+        Args:
+            track_id: Identifier of the track containing the clips.
+            clip_ids: Identifiers of the clips to retrieve.
+
+        Returns:
+            List of Clip models in the same order as clip_ids.
+
+        Raises:
+            ConnectionError: If connection to the API server fails.
+            requests.RequestException: For other HTTP-related errors.
+            pydantic.ValidationError: If a response cannot be parsed into Clip model.
+        """
+        calls = [
+            ("ppal-read-clip", {"trackId": track_id, "clipId": clip_id})
+            for clip_id in clip_ids
+        ]
+        return self._batch(calls, functools.partial(self._extract_model, model=Clip))
@@ -1,8 +1,16 @@
 """Pydantic models for Producer Pal API."""
 
-from typing import List, Optional
+from typing import Annotated, Any, Iterable, List, Optional, Sequence
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter
+
+# Position/length formats are checked by pydantic-core's compiled regex engine,
+# so decoding a Track with hundreds of notes never calls back into Python.
+BarBeat = Annotated[str, StringConstraints(pattern=r"^\d+\|\d+$")]
+"""Position in "bar|beat" format (e.g., "1|1")."""
+
+BarsBeats = Annotated[str, StringConstraints(pattern=r"^\d+:\d+$")]
+"""Duration or length in "bars:beats" format (e.g., "1:0")."""
 
 
 class Note(BaseModel):
@@ -17,42 +25,66 @@ class Note(BaseModel):
     """
 
     pitch: str
-    start: str
-    duration: str
+    start: BarBeat
+    duration: BarsBeats
     velocity: int = Field(default=80, ge=0, le=127)
     probability: float = Field(default=1.0, ge=0.0, le=1.0)
 
-    @field_validator("start")
-    @classmethod
-    def validate_start_format(cls, v: str) -> str:
-        """Validate start format is 'bar|beat'."""
-        if "|" not in v:
-            raise ValueError('start must be in format "bar|beat" (e.g., "1|1")')
-        parts = v.split("|")
-        if len(parts) != 2:
-            raise ValueError('start must be in format "bar|beat" (e.g., "1|1")')
-        try:
-            int(parts[0])
-            int(parts[1])
-        except ValueError:
-            raise ValueError('start must be in format "bar|beat" with numeric values')
-        return v
-
-    @field_validator("duration")
+    # Lazily computed model_dump() output, reset whenever a field changes.
+    # A plain slot rather than a PrivateAttr: private attributes add a Python
+    # init hook to every instance, which doubled decode time for large clips.
+    __slots__ = ("_dumped",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            object.__setattr__(self, "_dumped", None)
+
+    def dump_cached(self) -> dict:
+        """Return model_dump() output, computing it only once per instance.
+
+        Notes are typically reused across many create_midi_clip calls, so the
+        serialized dict is kept on the instance. The returned dict is shared
+        and must not be mutated by the caller.
+        """
+        dumped = getattr(self, "_dumped", None)
+        if dumped is None:
+            dumped = self.model_dump()
+            object.__setattr__(self, "_dumped", dumped)
+        return dumped
+
     @classmethod
-    def validate_duration_format(cls, v: str) -> str:
-        """Validate duration format is 'bars:beats'."""
-        if ":" not in v:
-            raise ValueError('duration must be in format "bars:beats" (e.g., "1:0")')
-        parts = v.split(":")
-        if len(parts) != 2:
-            raise ValueError('duration must be in format "bars:beats" (e.g., "1:0")')
-        try:
-            int(parts[0])
-            int(parts[1])
-        except ValueError:
-            raise ValueError('duration must be in format "bars:beats" with numeric values')
-        return v
+    def from_tuples(cls, rows: Iterable[Sequence[Any]]) -> List["Note"]:
+        """Build notes from (pitch, start, duration[, velocity[, probability]]) rows.
+
+        All rows are validated in a single pydantic-core call instead of one
+        constructor call per note. Omitted trailing fields take their defaults.
+
+        Args:
+            rows: Note rows, e.g. [("C3", "1|1", "1:0", 80), ...].
+
+        Returns:
+            List of validated notes, in row order.
+
+        Raises:
+            ValueError: If a row has more columns than a Note has fields.
+            pydantic.ValidationError: If any row is invalid.
+        """
+        fields = _NOTE_TUPLE_FIELDS
+        records = []
+        for row in rows:
+            if len(row) > len(fields):
+                raise ValueError(
+                    f"Note row has {len(row)} columns, expected at most "
+                    f"{len(fields)}: {row!r}"
+                )
+            records.append(dict(zip(fields, row)))
+        return _NOTE_LIST.validate_python(records)
+
+
+# Positional order of Note.from_tuples rows, and the list validator it uses
+_NOTE_TUPLE_FIELDS = ("pitch", "start", "duration", "velocity", "probability")
+_NOTE_LIST = TypeAdapter(List[Note])
 
 
 class Clip(BaseModel):
@@ -68,23 +100,7 @@ class Clip(BaseModel):
     id: int
     name: str
     notes: List[Note]
-    length: str
-
-    @field_validator("length")
-    @classmethod
-    def validate_length_format(cls, v: str) -> str:
-        """Validate length format is 'bars:beats'."""
-        if ":" not in v:
-            raise ValueError('length must be in format "bars:beats" (e.g., "1:0")')
-        parts = v.split(":")
-        if len(parts) != 2:
-            raise ValueError('length must be in format "bars:beats" (e.g., "1:0")')
-        try:
-            int(parts[0])
-            int(parts[1])
-        except ValueError:
-            raise ValueError('length must be in format "bars:beats" with numeric values')
-        return v
+    length: BarsBeats
 
 
 class Track(BaseModel):
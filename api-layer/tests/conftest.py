@@ -0,0 +1,12 @@
+"""Shared pytest fixtures for api-layer tests."""
+
+import pytest
+
+from api_layer.client import ProducerPalClient
+
+
+@pytest.fixture(autouse=True)
+def close_shared_sessions():
+    """Drop the process-wide HTTP sessions after each test."""
+    yield
+    ProducerPalClient.close_all()
@@ -1,9 +1,12 @@
 """Tests for ProducerPalClient."""
 
+import json
+
 import pytest
 import requests
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
+from api_layer import client as client_module
 from api_layer.client import ProducerPalClient
 from api_layer.models import Clip, Note, Track
 
@@ -19,6 +22,7 @@ def mock_response(mocker):
     """Create a mock response object."""
     response = mocker.Mock(spec=requests.Response)
     response.raise_for_status = mocker.Mock()
+    response.headers = {"Content-Type": "application/json"}
     return response
 
 
@@ -26,8 +30,10 @@ def test_get_project_info_success(client: ProducerPalClient, mock_response, mock
     """Test successful get_project_info call."""
     # Arrange
     expected_data = {"tempo": 120.0, "tracks": []}
-    mock_response.json.return_value = expected_data
-    mock_post = mocker.patch("api_layer.client.requests.post", return_value=mock_response)
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": expected_data, "id": 1}
+    ).encode()
+    mock_post = mocker.patch.object(client._session, "post", return_value=mock_response)
 
     # Act
     result = client.get_project_info()
@@ -38,22 +44,29 @@ def test_get_project_info_success(client: ProducerPalClient, mock_response, mock
     mock_post.assert_called_once()
     call_args = mock_post.call_args
     assert call_args[0][0] == "http://localhost:3350/mcp"
-    assert call_args[1]["json"] == {
+    assert json.loads(call_args[1]["data"]) == {
+        "jsonrpc": "2.0",
         "method": "tools/call",
         "params": {
             "name": "ppal-read-live-set",
             "arguments": {},
         },
+        "id": 1,
+    }
+    assert call_args[1]["headers"] == {
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream",
     }
-    assert call_args[1]["headers"] == {"Content-Type": "application/json"}
     assert call_args[1]["timeout"] == 30
+    assert client._session.headers["Content-Type"] == "application/json"
+    assert client._session.headers["Accept"] == "application/json, text/event-stream"
 
 
 def test_get_project_info_connection_error(client: ProducerPalClient, mocker):
     """Test get_project_info raises ConnectionError on connection failure."""
     # Arrange
     connection_error = RequestsConnectionError("Connection refused")
-    mocker.patch("api_layer.client.requests.post", side_effect=connection_error)
+    mocker.patch.object(client._session, "post", side_effect=connection_error)
 
     # Act & Assert
     with pytest.raises(ConnectionError) as exc_info:
@@ -86,8 +99,10 @@ def test_get_track_success(client: ProducerPalClient, mock_response, mocker):
             }
         ],
     }
-    mock_response.json.return_value = track_data
-    mocker.patch("api_layer.client.requests.post", return_value=mock_response)
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": track_data, "id": 1}
+    ).encode()
+    mocker.patch.object(client._session, "post", return_value=mock_response)
 
     # Act
     result = client.get_track(track_id=1)
@@ -116,8 +131,10 @@ def test_create_midi_clip(client: ProducerPalClient, mock_response, mocker):
         "notes": [note.model_dump() for note in notes],
         "length": "4:0",
     }
-    mock_response.json.return_value = clip_data
-    mock_post = mocker.patch("api_layer.client.requests.post", return_value=mock_response)
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": clip_data, "id": 1}
+    ).encode()
+    mock_post = mocker.patch.object(client._session, "post", return_value=mock_response)
 
     # Act
     result = client.create_midi_clip(track_id=1, notes=notes)
@@ -130,7 +147,7 @@ def test_create_midi_clip(client: ProducerPalClient, mock_response, mocker):
 
     # Verify that notes were serialized correctly in the request
     call_args = mock_post.call_args
-    request_payload = call_args[1]["json"]
+    request_payload = json.loads(call_args[1]["data"])
     assert request_payload["params"]["name"] == "ppal-create-clip"
     assert request_payload["params"]["arguments"]["trackId"] == 1
     assert len(request_payload["params"]["arguments"]["notes"]) == 3
@@ -140,3 +157,194 @@ def test_create_midi_clip(client: ProducerPalClient, mock_response, mocker):
     assert request_payload["params"]["arguments"]["notes"][0]["velocity"] == 80
     assert request_payload["params"]["arguments"]["notes"][1]["velocity"] == 90
     assert request_payload["params"]["arguments"]["notes"][2]["velocity"] == 100
+
+
+def test_clients_share_session_per_base_url():
+    """Test clients for the same server reuse one session, others get their own."""
+    first = ProducerPalClient(base_url="http://localhost:3350")
+    second = ProducerPalClient(base_url="http://localhost:3350/")
+    other = ProducerPalClient(base_url="http://127.0.0.1:4000")
+
+    assert first._session is second._session
+    assert other._session is not first._session
+
+
+def test_context_manager_keeps_shared_session_open(mocker):
+    """Test leaving the context manager does not close the shared session."""
+    # Arrange
+    client = ProducerPalClient(base_url="http://localhost:3350")
+    mock_close = mocker.patch.object(client._session, "close")
+
+    # Act
+    with client as entered:
+        assert entered is client
+
+    # Assert
+    mock_close.assert_not_called()
+
+
+def test_close_all_closes_shared_sessions(mocker):
+    """Test close_all closes every shared session and drops it from the registry."""
+    # Arrange
+    client = ProducerPalClient(base_url="http://localhost:3350")
+    mock_close = mocker.patch.object(client._session, "close")
+
+    # Act
+    ProducerPalClient.close_all()
+
+    # Assert
+    mock_close.assert_called_once()
+    assert ProducerPalClient(base_url="http://localhost:3350")._session is not (
+        client._session
+    )
+
+
+def test_injected_session_is_used_and_not_shared(mocker):
+    """Test a caller-owned session is used as-is and left out of the registry."""
+    # Arrange
+    session = requests.Session()
+    headers_before = dict(session.headers)
+    mock_close = mocker.patch.object(session, "close")
+
+    # Act
+    client = ProducerPalClient(session=session)
+    ProducerPalClient.close_all()
+
+    # Assert
+    assert client._session is session
+    assert dict(session.headers) == headers_before
+    assert ProducerPalClient()._session is not session
+    mock_close.assert_not_called()
+
+
+def test_injected_plain_session_sends_mcp_headers(mocker):
+    """Test requests' default Accept: */* does not replace the MCP Accept header."""
+    # Arrange
+    session = requests.Session()
+    mock_response = mocker.Mock(spec=requests.Response)
+    mock_response.raise_for_status = mocker.Mock()
+    mock_response.headers = {"Content-Type": "application/json"}
+    mock_response.content = b'{"jsonrpc": "2.0", "result": {"tempo": 120}, "id": 1}'
+    mock_send = mocker.patch.object(session, "send", return_value=mock_response)
+    client = ProducerPalClient(session=session)
+
+    # Act
+    client.get_project_info()
+
+    # Assert
+    sent = mock_send.call_args[0][0]
+    assert "text/event-stream" in sent.headers["Accept"]
+    assert sent.headers["Content-Type"] == "application/json"
+
+
+def test_parse_js_object_quotes_keys(client: ProducerPalClient):
+    """Test unquoted keys are quoted, including nested objects and arrays."""
+    js_text = '{id:"1", tempo:120, tracks:[{id:2,name:"Bass",muted:false}], x : null}'
+
+    result = client._parse_js_object(js_text)
+
+    assert result == {
+        "id": "1",
+        "tempo": 120,
+        "tracks": [{"id": 2, "name": "Bass", "muted": False}],
+        "x": None,
+    }
+
+
+def test_parse_js_object_leaves_string_values_untouched(client: ProducerPalClient):
+    """Test colons inside string values are not treated as keys."""
+    js_text = '{name:"note:C3",label:"a, b:c",escaped:"say \\"hi:there\\""}'
+
+    result = client._parse_js_object(js_text)
+
+    assert result == {
+        "name": "note:C3",
+        "label": "a, b:c",
+        "escaped": 'say "hi:there"',
+    }
+
+
+def test_parse_js_object_accepts_plain_json(client: ProducerPalClient):
+    """Test already-quoted JSON passes through unchanged."""
+    js_text = '{"id": 1, "notes": ["C3", "E3"], "meta": {"key": "value:1"}}'
+
+    result = client._parse_js_object(js_text)
+
+    assert result == {"id": 1, "notes": ["C3", "E3"], "meta": {"key": "value:1"}}
+
+
+def test_parse_js_object_memoizes_repeated_text(client: ProducerPalClient):
+    """Test identical responses hit the cache but still yield independent dicts."""
+    client_module._quote_js_keys_cached.cache_clear()
+    js_text = '{id:1,name:"Lead"}'
+
+    first = client._parse_js_object(js_text)
+    first["name"] = "mutated"
+    second = client._parse_js_object(js_text)
+
+    assert second == {"id": 1, "name": "Lead"}
+    assert client_module._quote_js_keys_cached.cache_info().hits == 1
+
+
+def test_parse_js_object_skips_cache_for_large_text(client: ProducerPalClient):
+    """Test oversized responses bypass the memoization cache."""
+    client_module._quote_js_keys_cached.cache_clear()
+    js_text = '{id:1,name:"' + "x" * client_module._JS_CACHE_MAX_TEXT + '"}'
+
+    result = client._parse_js_object(js_text)
+
+    assert result["id"] == 1
+    assert client_module._quote_js_keys_cached.cache_info().currsize == 0
+
+
+def test_parse_js_object_plain_json_skips_key_quoting(
+    client: ProducerPalClient, mocker
+):
+    """Test text that is already JSON is decoded without the key-quoting pass."""
+    quote = mocker.patch.object(client_module, "_quote_js_keys_cached")
+
+    result = client._parse_js_object('{"id": 1, "name": "Pad"}')
+
+    assert result == {"id": 1, "name": "Pad"}
+    quote.assert_not_called()
+
+
+def test_parse_js_object_mixed_notation_falls_back(client: ProducerPalClient):
+    """Test a quoted first key followed by unquoted keys still parses."""
+    result = client._parse_js_object('{"id": 1, name: "Pad"}')
+
+    assert result == {"id": 1, "name": "Pad"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'data: {"id": 1}',
+        b'data: {"id": 1}\n\n',
+        b'event: message\r\ndata: {"id": 1}\r\n\r\n',
+        b': keepalive\n\nevent: message\nid: 7\ndata: {"id": 1}\n\ndata: {"id": 2}\n',
+    ],
+    ids=["bare", "terminated", "crlf", "comments-and-second-event"],
+)
+def test_parse_sse_returns_first_data_field(client: ProducerPalClient, body: bytes):
+    """Test the first data field is decoded regardless of surrounding fields."""
+    assert client._parse_sse(body) == {"id": 1}
+
+
+def test_parse_sse_without_data_raises(client: ProducerPalClient):
+    """Test an SSE body with no data field raises ValueError."""
+    with pytest.raises(ValueError, match="No data in SSE response"):
+        client._parse_sse(b"event: message\n: no payload\n\n")
+
+
+@pytest.mark.parametrize("scheme", ["http://", "https://"])
+def test_session_retries_transient_failures(client: ProducerPalClient, scheme: str):
+    """Test both schemes share an adapter that retries gateway errors."""
+    adapter = client._session.get_adapter(f"{scheme}localhost:3350/mcp")
+    retry = adapter.max_retries
+
+    assert retry.total == 3
+    assert retry.read == 0
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    assert "POST" in retry.allowed_methods
+    assert retry.raise_on_status is False
@@ -1,11 +1,14 @@
 """Integration-style tests for Producer Pal client with JSON-RPC 2.0."""
 
+import json
+
 import pytest
 import requests
-from unittest.mock import Mock, patch
+from pydantic import ValidationError
+from unittest.mock import Mock, PropertyMock, patch
 
 from api_layer.client import ProducerPalClient
-from api_layer.models import Note
+from api_layer.models import Clip, Note
 
 
 @pytest.fixture
@@ -23,28 +26,26 @@ def mock_response():
     return response
 
 
-@patch("api_layer.client.requests.post")
+@patch("api_layer.client.requests.Session.post")
 def test_get_project_info_success(mock_post, client, mock_response):
     """Test successful get_project_info returns result from JSON-RPC 2.0 response."""
     expected_data = {"tempo": 120.0, "tracks": []}
-    mock_response.json.return_value = {
-        "jsonrpc": "2.0",
-        "result": expected_data,
-        "id": 1,
-    }
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": expected_data, "id": 1}
+    ).encode()
     mock_post.return_value = mock_response
 
     result = client.get_project_info()
 
     assert result == expected_data
-    payload = mock_post.call_args[1]["json"]
+    payload = json.loads(mock_post.call_args[1]["data"])
     assert "jsonrpc" in payload
     assert payload["jsonrpc"] == "2.0"
     assert "id" in payload
     assert payload["id"] == 1
 
 
-@patch("api_layer.client.requests.post")
+@patch("api_layer.client.requests.Session.post")
 def test_get_track_success(mock_post, client, mock_response):
     """Test successful get_track returns Track from JSON-RPC 2.0 result."""
     from api_layer.models import Track
@@ -69,11 +70,9 @@ def test_get_track_success(mock_post, client, mock_response):
             }
         ],
     }
-    mock_response.json.return_value = {
-        "jsonrpc": "2.0",
-        "result": track_data,
-        "id": 1,
-    }
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": track_data, "id": 1}
+    ).encode()
     mock_post.return_value = mock_response
 
     result = client.get_track(track_id=1)
@@ -81,12 +80,12 @@ def test_get_track_success(mock_post, client, mock_response):
     assert isinstance(result, Track)
     assert result.id == 1
     assert result.name == "Test Track"
-    payload = mock_post.call_args[1]["json"]
+    payload = json.loads(mock_post.call_args[1]["data"])
     assert "jsonrpc" in payload
     assert "id" in payload
 
 
-@patch("api_layer.client.requests.post")
+@patch("api_layer.client.requests.Session.post")
 def test_create_midi_clip_success(mock_post, client, mock_response):
     """Test create_midi_clip sends JSON-RPC 2.0 and uses result."""
     from api_layer.models import Clip
@@ -101,23 +100,21 @@ def test_create_midi_clip_success(mock_post, client, mock_response):
         "notes": [note.model_dump() for note in notes],
         "length": "4:0",
     }
-    mock_response.json.return_value = {
-        "jsonrpc": "2.0",
-        "result": clip_data,
-        "id": 1,
-    }
+    mock_response.content = json.dumps(
+        {"jsonrpc": "2.0", "result": clip_data, "id": 1}
+    ).encode()
     mock_post.return_value = mock_response
 
     result = client.create_midi_clip(track_id=1, notes=notes)
 
     assert isinstance(result, Clip)
     assert result.id == 1
-    payload = mock_post.call_args[1]["json"]
+    payload = json.loads(mock_post.call_args[1]["data"])
     assert "jsonrpc" in payload
     assert "id" in payload
 
 
-@patch("api_layer.client.requests.post")
+@patch("api_layer.client.requests.Session.post")
 def test_json_rpc_error(mock_post, client, mock_response):
     """Test that JSON-RPC error response raises ValueError."""
     error_response = {
@@ -125,10 +122,284 @@ def test_json_rpc_error(mock_post, client, mock_response):
         "error": {"code": -32600, "message": "Invalid params"},
         "id": 1,
     }
-    mock_response.json.return_value = error_response
+    mock_response.content = json.dumps(error_response).encode()
     mock_post.return_value = mock_response
 
     with pytest.raises(ValueError) as exc_info:
         client.get_project_info()
 
     assert "JSON-RPC error" in str(exc_info.value)
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_get_tracks_preserves_order(mock_post, client):
+    """Test get_tracks fetches every track and returns them in request order."""
+
+    def respond(url, **kwargs):
+        track_id = json.loads(kwargs["data"])["params"]["arguments"]["trackId"]
+        response = Mock(spec=requests.Response)
+        response.raise_for_status = Mock()
+        response.headers = {"Content-Type": "application/json"}
+        track_data = {"id": track_id, "name": f"Track {track_id}"}
+        response.content = json.dumps(
+            {"jsonrpc": "2.0", "result": track_data, "id": 1}
+        ).encode()
+        return response
+
+    mock_post.side_effect = respond
+
+    result = client.get_tracks([3, 1, 2])
+
+    assert [track.id for track in result] == [3, 1, 2]
+    assert [track.name for track in result] == ["Track 3", "Track 1", "Track 2"]
+    assert mock_post.call_count == 3
+
+
+def test_get_tracks_empty(client):
+    """Test get_tracks with no ids returns an empty list without any request."""
+    assert client.get_tracks([]) == []
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_sse_response_with_js_notation(mock_post, client, mock_response):
+    """Test SSE body is parsed from bytes and inner JS notation is decoded."""
+    inner = '{id:1,name:"Lead",clips:[]}'
+    frame = json.dumps(
+        {"jsonrpc": "2.0", "result": {"content": [{"type": "text", "text": inner}]}}
+    )
+    mock_response.headers = {"Content-Type": "text/event-stream"}
+    mock_response.content = f"event: message\ndata: {frame}\n\n".encode()
+    mock_post.return_value = mock_response
+
+    result = client.get_track(track_id=1)
+
+    assert result.id == 1
+    assert result.name == "Lead"
+
+
+def _clip_result(clip_id: int, request_id: int) -> dict:
+    """Build a JSON-RPC response carrying a minimal clip."""
+    clip = {"id": clip_id, "name": f"Clip {clip_id}", "notes": [], "length": "4:0"}
+    return {"jsonrpc": "2.0", "result": clip, "id": request_id}
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_get_clips_sends_single_batch(mock_post, client, mock_response):
+    """Test get_clips sends one batch request and orders results by id."""
+    # Server may answer a batch in any order
+    mock_response.content = json.dumps(
+        [_clip_result(7, 1), _clip_result(5, 0)]
+    ).encode()
+    mock_post.return_value = mock_response
+
+    result = client.get_clips(track_id=1, clip_ids=[5, 7])
+
+    assert [clip.id for clip in result] == [5, 7]
+    mock_post.assert_called_once()
+    payload = json.loads(mock_post.call_args[1]["data"])
+    assert isinstance(payload, list)
+    assert [request["id"] for request in payload] == [0, 1]
+    assert payload[1]["params"] == {
+        "name": "ppal-read-clip",
+        "arguments": {"trackId": 1, "clipId": 7},
+    }
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_falls_back_when_unsupported(mock_post, client):
+    """Test a non-array reply to a batch falls back to sequential calls."""
+    responses = [
+        {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Batch"}, "id": None},
+        _clip_result(5, 1),
+        _clip_result(7, 1),
+        _clip_result(9, 1),
+    ]
+
+    def respond(url, **kwargs):
+        response = Mock(spec=requests.Response)
+        response.raise_for_status = Mock()
+        response.headers = {"Content-Type": "application/json"}
+        response.content = json.dumps(responses.pop(0)).encode()
+        return response
+
+    mock_post.side_effect = respond
+
+    first = client.get_clips(track_id=1, clip_ids=[5, 7])
+    second = client.get_clips(track_id=1, clip_ids=[9])
+
+    assert [clip.id for clip in first] == [5, 7]
+    assert [clip.id for clip in second] == [9]
+    # One rejected batch probe, then only single requests
+    sent = [json.loads(c[1]["data"]) for c in mock_post.call_args_list]
+    assert isinstance(sent[0], list)
+    assert all(isinstance(payload, dict) for payload in sent[1:])
+    assert client._batch_supported is False
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_falls_back_on_http_error(mock_post, client, mock_response):
+    """Test a 4xx rejection of the batch request falls back to single calls."""
+    rejected = Mock(spec=requests.Response)
+    rejected.status_code = 400
+    rejected.raise_for_status = Mock(
+        side_effect=requests.HTTPError("400", response=rejected)
+    )
+    mock_response.content = json.dumps(_clip_result(5, 1)).encode()
+    mock_post.side_effect = [rejected, mock_response]
+
+    result = client.get_clips(track_id=1, clip_ids=[5])
+
+    assert [clip.id for clip in result] == [5]
+    assert mock_post.call_count == 2
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_server_error_is_not_resent(mock_post, client):
+    """Test a 5xx on the batch raises instead of re-sending every call."""
+    failed = Mock(spec=requests.Response)
+    failed.status_code = 500
+    failed.raise_for_status = Mock(side_effect=requests.HTTPError("500", response=failed))
+    mock_post.return_value = failed
+
+    with pytest.raises(requests.HTTPError):
+        client.call_batch([("ppal-create-clip", {"trackId": 1})] * 2)
+
+    mock_post.assert_called_once()
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_collects_one_sse_event_per_response(
+    mock_post, client, mock_response
+):
+    """Test a batch answered with one SSE event per request is sent only once."""
+    events = "".join(
+        f"event: message\ndata: {json.dumps(_clip_result(clip_id, i))}\n\n"
+        for i, clip_id in enumerate([5, 7])
+    )
+    mock_response.headers = {"Content-Type": "text/event-stream"}
+    mock_response.content = events.encode()
+    mock_post.return_value = mock_response
+
+    result = client.call_batch(
+        [("ppal-create-clip", {"trackId": 1}), ("ppal-create-clip", {"trackId": 1})]
+    )
+
+    assert [clip["id"] for clip in result] == [5, 7]
+    mock_post.assert_called_once()
+    assert client._batch_supported is True
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_resends_only_missing_calls(mock_post, client):
+    """Test calls answered in the batch reply are never sent again."""
+    replies = [[_clip_result(5, 0)], _clip_result(7, 1)]
+
+    def respond(url, **kwargs):
+        response = Mock(spec=requests.Response)
+        response.raise_for_status = Mock()
+        response.headers = {"Content-Type": "application/json"}
+        response.content = json.dumps(replies.pop(0)).encode()
+        return response
+
+    mock_post.side_effect = respond
+
+    result = client.get_clips(track_id=1, clip_ids=[5, 7])
+
+    assert [clip.id for clip in result] == [5, 7]
+    sent = [json.loads(c[1]["data"]) for c in mock_post.call_args_list]
+    assert len(sent) == 2
+    assert sent[1]["params"]["arguments"] == {"trackId": 1, "clipId": 7}
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_call_batch_unmatched_reply_raises(mock_post, client, mock_response):
+    """Test a reply matching none of the batch ids raises without re-sending."""
+    mock_response.content = json.dumps(_clip_result(5, 99)).encode()
+    mock_post.return_value = mock_response
+
+    with pytest.raises(ValueError, match="Unexpected reply"):
+        client.call_batch([("ppal-read-clip", {"trackId": 1, "clipId": 5})])
+
+    mock_post.assert_called_once()
+
+
+def test_call_batch_empty(client):
+    """Test call_batch with no calls returns an empty list without any request."""
+    assert client.call_batch([]) == []
+
+
+def _text_content_response(text: str) -> bytes:
+    """Build a JSON-RPC body whose result is a single MCP text block."""
+    result = {"content": [{"type": "text", "text": text}]}
+    return json.dumps({"jsonrpc": "2.0", "result": result, "id": 1}).encode()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{id:3,name:"Keys",notes:[{pitch:"C3",start:"1|1",duration:"1:0"}],length:"4:0"}',
+        '{"id":3,"name":"Keys","notes":[{"pitch":"C3","start":"1|1","duration":"1:0"}],"length":"4:0"}',
+        '{"id":3,name:"Keys",notes:[{pitch:"C3",start:"1|1",duration:"1:0"}],length:"4:0"}',
+    ],
+    ids=["js-notation", "json", "mixed"],
+)
+@patch("api_layer.client.requests.Session.post")
+def test_get_clip_validates_text_content(mock_post, client, mock_response, text):
+    """Test get_clip decodes JS, JSON and mixed text content into a Clip."""
+    mock_response.content = _text_content_response(text)
+    mock_post.return_value = mock_response
+
+    result = client.get_clip(track_id=1, clip_id=3)
+
+    assert isinstance(result, Clip)
+    assert result.id == 3
+    assert result.notes[0].pitch == "C3"
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_get_clip_invalid_json_data_raises(mock_post, client, mock_response):
+    """Test well-formed JSON with invalid fields raises ValidationError."""
+    text = '{"id":3,"name":"Keys","notes":[],"length":"four bars"}'
+    mock_response.content = _text_content_response(text)
+    mock_post.return_value = mock_response
+
+    with pytest.raises(ValidationError):
+        client.get_clip(track_id=1, clip_id=3)
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["text/event-stream", "text/event-stream; charset=utf-8"],
+)
+@patch("api_layer.client.requests.Session.post")
+def test_utf8_body_decoded_from_bytes(
+    mock_post, client, mock_response, content_type
+):
+    """Test UTF-8 bodies are decoded from content without touching .text."""
+    frame = json.dumps(
+        {"jsonrpc": "2.0", "result": {"name": "Café"}}, ensure_ascii=False
+    )
+    mock_response.headers = {"Content-Type": content_type}
+    mock_response.content = f"data: {frame}\n\n".encode()
+    text = PropertyMock()
+    type(mock_response).text = text
+    mock_post.return_value = mock_response
+
+    assert client.get_project_info() == {"name": "Café"}
+    text.assert_not_called()
+
+
+@patch("api_layer.client.requests.Session.post")
+def test_declared_non_utf8_charset_is_transcoded(mock_post, client, mock_response):
+    """Test a body in an explicitly declared non-UTF-8 charset decodes correctly."""
+    frame = json.dumps(
+        {"jsonrpc": "2.0", "result": {"name": "Café"}}, ensure_ascii=False
+    )
+    sse_text = f"data: {frame}\n\n"
+    content_type = 'text/event-stream; charset="ISO-8859-1"'
+    mock_response.headers = {"Content-Type": content_type}
+    mock_response.content = sse_text.encode("iso-8859-1")
+    mock_response.text = sse_text
+    mock_post.return_value = mock_response
+
+    assert client.get_project_info() == {"name": "Café"}
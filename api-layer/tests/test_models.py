@@ -0,0 +1,107 @@
+"""Tests for Producer Pal API models."""
+
+import pytest
+from pydantic import ValidationError
+
+from api_layer.models import Clip, Note
+
+
+def test_note_dump_cached_matches_model_dump():
+    """Test dump_cached returns model_dump output and reuses it."""
+    # Arrange
+    note = Note(pitch="C3", start="1|1", duration="1:0", velocity=90)
+
+    # Act
+    first = note.dump_cached()
+    second = note.dump_cached()
+
+    # Assert
+    assert first == note.model_dump()
+    assert second is first
+
+
+def test_note_dump_cached_invalidated_on_assignment():
+    """Test assigning a field drops the cached dump."""
+    # Arrange
+    note = Note(pitch="C3", start="1|1", duration="1:0")
+    note.dump_cached()
+
+    # Act
+    note.velocity = 100
+
+    # Assert
+    assert note.dump_cached()["velocity"] == 100
+
+
+def test_note_dump_cached_invalidated_on_model_copy_update():
+    """Test model_copy with updates does not inherit a stale cached dump."""
+    # Arrange
+    note = Note(pitch="C3", start="1|1", duration="1:0")
+    note.dump_cached()
+
+    # Act
+    copied = note.model_copy(update={"pitch": "G3"})
+
+    # Assert
+    assert copied.dump_cached()["pitch"] == "G3"
+    assert note.dump_cached()["pitch"] == "C3"
+
+
+def test_note_from_tuples_matches_keyword_construction():
+    """Test from_tuples builds the same notes as the keyword constructor."""
+    # Act
+    notes = Note.from_tuples(
+        [("C3", "1|1", "1:0", 80), ("E3", "2|1", "1:0", 90, 0.5), ("G3", "3|1", "2:0")]
+    )
+
+    # Assert
+    assert notes == [
+        Note(pitch="C3", start="1|1", duration="1:0", velocity=80),
+        Note(pitch="E3", start="2|1", duration="1:0", velocity=90, probability=0.5),
+        Note(pitch="G3", start="3|1", duration="2:0"),
+    ]
+    assert notes[2].dump_cached() == notes[2].model_dump()
+
+
+@pytest.mark.parametrize(
+    "bad_row",
+    [
+        ("E3", "2.1", "1:0"),  # malformed start
+        ("E3", "2|1", "1:0", 80, 1.0, "oops"),  # extra column
+    ],
+)
+def test_note_from_tuples_rejects_invalid_row(bad_row):
+    """Test from_tuples validates every row and rejects extra columns."""
+    with pytest.raises(ValueError):
+        Note.from_tuples([("C3", "1|1", "1:0"), bad_row])
+
+
+@pytest.mark.parametrize("start", ["1|1", "12|4", "100|16"])
+def test_note_accepts_bar_beat_start(start: str):
+    """Test valid "bar|beat" start positions are accepted."""
+    assert Note(pitch="C3", start=start, duration="1:0").start == start
+
+
+@pytest.mark.parametrize(
+    "start", ["1", "1:1", "1|x", "1|1|1", "|1", " 1|1", "1|1\n", "x1|1"]
+)
+def test_note_rejects_malformed_start(start: str):
+    """Test malformed start positions raise ValidationError."""
+    with pytest.raises(ValidationError):
+        Note(pitch="C3", start=start, duration="1:0")
+
+
+@pytest.mark.parametrize(
+    "duration", ["1", "1|0", "1:x", "1:0:0", "1:", "1:0\n", "-1:0"]
+)
+def test_note_rejects_malformed_duration(duration: str):
+    """Test malformed durations raise ValidationError."""
+    with pytest.raises(ValidationError):
+        Note(pitch="C3", start="1|1", duration=duration)
+
+
+@pytest.mark.parametrize("length", ["4", "4|0", "a:b", "4:0:0", "4:0 "])
+def test_clip_rejects_malformed_length(length: str):
+    """Test malformed clip lengths raise ValidationError."""
+    with pytest.raises(ValidationError):
+        Clip(id=1, name="Clip", notes=[], length=length)
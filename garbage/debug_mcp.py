@@ -0,0 +1,249 @@
+"""Debug what Producer Pal returns for ppal-read-live-set.
+
+Usage:
+    python debug_mcp.py basic            # raw response, no SSE in Accept
+    python debug_mcp.py accept           # correct Accept header, JSON parse
+    python debug_mcp.py sse              # correct Accept header, SSE parse
+    python debug_mcp.py basic accept sse # several variants, one process
+
+Running variants back-to-back in one process pays interpreter startup,
+imports and the TCP handshake once: every variant shares SESSION.
+"""
+
+import sys
+import json
+import traceback
+
+import requests
+
+from mcp_session import SESSION, VERBOSE, dumps, loads, pretty, read_body
+
+url = "http://localhost:3350/mcp"
+# (connect, read): fail fast when Producer Pal is not listening
+_TIMEOUT = (2.0, 30.0)
+_HR = "=" * 60
+_HR2 = "-" * 60
+
+payload = {
+    "jsonrpc": "2.0",
+    "method": "tools/call",
+    "params": {
+        "name": "ppal-read-live-set",
+        "arguments": {}
+    },
+    "id": 1
+}
+# Fixed request: serialize once at import, POST the bytes as-is
+_READ_LIVE_SET_BODY = dumps(payload)
+
+
+def print_connection_help(e):
+    print(f"\n✗ Connection failed: {e}")
+    print("\nMake sure:")
+    print("  1. Ableton Live is running")
+    print("  2. Producer Pal device is loaded")
+    print("  3. Producer Pal shows 'Server running on port 3350'")
+
+
+def parse_sse_response(body):
+    """Parse Server-Sent Events format, joining multi-line data fields.
+
+    Only "data: " at the start of a line is a data field.
+    """
+    i = 0 if body.startswith(b'data: ') else body.find(b'\ndata: ')
+    if i == -1:
+        raise ValueError("No data found in SSE response")
+    if i:
+        i += 1  # skip the newline
+    j = body.find(b'\n', i + 6)
+    if j == -1 or body.find(b'\ndata: ', j) == -1:
+        # Common case: a single data line, parsed straight from the slice
+        return loads(body[i + 6:j] if j != -1 else body[i + 6:])
+
+    buf = bytearray()
+    while i != -1:
+        j = body.find(b'\n', i + 6)
+        if j == -1:
+            j = len(body)
+        # Append data after "data: " prefix; multi-line frames concatenate
+        buf += body[i + 6:j]
+        i = body.find(b'\ndata: ', j)
+        if i != -1:
+            i += 1
+
+    return loads(bytes(buf))
+
+
+def debug_basic():
+    """Dump the raw response to a request without SSE in Accept."""
+    print(_HR)
+    print("DEBUG: Producer Pal Response")
+    print(_HR)
+
+    print("\n[1] Sending request to:", url)
+    if VERBOSE:
+        print("Payload:", json.dumps(payload, indent=2))
+
+    try:
+        # Override the session's Accept header: this variant reproduces the
+        # original request without "Accept: text/event-stream"
+        response = SESSION.post(
+            url,
+            data=_READ_LIVE_SET_BODY,
+            headers={"Accept": "*/*"},
+            timeout=_TIMEOUT
+        )
+
+        print("\n[2] Response received:")
+        print(f"  Status Code: {response.status_code}")
+        print(f"  Content-Type: {response.headers.get('Content-Type')}")
+        print(f"  Content-Length: {response.headers.get('Content-Length')}")
+
+        print("\n[3] Raw response text:")
+        print(_HR2)
+        print(response.text)
+        print(_HR2)
+
+        print("\n[4] Attempting JSON parse...")
+        if response.content:
+            data = loads(response.content)
+            print("✓ Valid JSON:")
+            print(pretty(data))
+        else:
+            print("✗ Empty response body!")
+
+    except requests.ConnectionError as e:
+        print_connection_help(e)
+    except requests.HTTPError as e:
+        print(f"\n✗ HTTP error: {e}")
+        print(f"Response: {response.text}")
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        traceback.print_exc()
+
+
+def debug_with_accept():
+    """Send the correct Accept header and parse the body as plain JSON."""
+    print(_HR)
+    print("DEBUG: Producer Pal Response (with correct headers)")
+    print(_HR)
+
+    print("\n[1] Sending request to:", url)
+    # FIXED: SESSION sends "Accept: application/json, text/event-stream"
+    if VERBOSE:
+        mcp_headers = {name: SESSION.headers[name] for name in ("Content-Type", "Accept")}
+        print("Headers:", json.dumps(mcp_headers, indent=2))
+        print("Payload:", json.dumps(payload, indent=2))
+
+    try:
+        response = SESSION.post(
+            url,
+            data=_READ_LIVE_SET_BODY,
+            timeout=_TIMEOUT,
+            stream=True
+        )
+        body = read_body(response)
+
+        print("\n[2] Response received:")
+        print(f"  Status Code: {response.status_code}")
+        print(f"  Content-Type: {response.headers.get('Content-Type')}")
+
+        print("\n[3] Raw response (first 500 chars):")
+        print(_HR2)
+        print(body[:500].decode('utf-8', 'replace'))
+        print(_HR2)
+
+        if response.status_code == 200:
+            print("\n[4] Parsed JSON:")
+            data = loads(body)
+
+            if "error" in data:
+                print(f"✗ JSON-RPC Error: {data['error']}")
+            elif "result" in data:
+                print("✓ Success!")
+                result = data['result']
+                print(f"  Tempo: {result.get('tempo', 'N/A')}")
+                print(f"  Tracks count: {len(result.get('tracks', []))}")
+            else:
+                print("Unexpected response format:")
+                print(pretty(data))
+        else:
+            print(f"\n✗ HTTP Error {response.status_code}")
+            print(body.decode('utf-8', 'replace'))
+
+    except requests.ConnectionError as e:
+        print_connection_help(e)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        traceback.print_exc()
+
+
+def debug_sse():
+    """Send the correct Accept header and parse the SSE stream."""
+    print(_HR)
+    print("DEBUG: Producer Pal with SSE parsing")
+    print(_HR)
+
+    try:
+        response = SESSION.post(url, data=_READ_LIVE_SET_BODY, timeout=_TIMEOUT, stream=True)
+        body = read_body(response)
+
+        print(f"\n[1] Status: {response.status_code}")
+        print(f"    Content-Type: {response.headers.get('Content-Type')}")
+
+        content_type = response.headers.get('Content-Type', '')
+
+        if content_type.startswith('text/event-stream'):
+            print("\n[2] Parsing SSE format...")
+            print(f"    Raw SSE (first 300 chars):\n{body[:300].decode('utf-8', 'replace')}")
+
+            data = parse_sse_response(body)
+            print("\n[3] ✓ SSE parsed successfully!")
+
+            if "result" in data:
+                result = data["result"]
+                print(f"\n[4] Result structure:")
+                print(f"    Keys: {list(result.keys())}")
+
+                # If there's 'content', extract it
+                if "content" in result:
+                    content = result["content"]
+                    if content and isinstance(content, list) and len(content) > 0:
+                        first_item = content[0]
+                        if first_item.get("type") == "text":
+                            # Parse the inner text JSON
+                            inner_json_str = first_item.get("text", "")
+                            print(f"\n[5] Inner content (first 500 chars):")
+                            print(inner_json_str[:500])
+
+                            # Try to parse inner JSON (it might be a JSON string)
+                            # Note: The text might be JSON with unquoted keys - need to handle that
+                            print(f"\n[6] This looks like JSON with unquoted keys")
+                            print("    Producer Pal returns nested JSON in 'text' field")
+            else:
+                print(pretty(data))
+        else:
+            print("\n[2] Parsing regular JSON...")
+            data = loads(body)
+            print(pretty(data))
+
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        traceback.print_exc()
+
+
+VARIANTS = {
+    "basic": debug_basic,
+    "accept": debug_with_accept,
+    "sse": debug_sse,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:]
+    if not names or any(name not in VARIANTS for name in names):
+        print(f"Usage: python {sys.argv[0]} {{{'|'.join(VARIANTS)}}} [...]")
+        sys.exit(2)
+
+    for name in names:
+        VARIANTS[name]()
@@ -1,46 +1,112 @@
 """Test full parsing pipeline: SSE → MCP → JS object."""
 
-import requests
-import json
 import re
+import traceback
+
+from mcp_session import SESSION, dumps, loads, read_body
 
 url = "http://localhost:3350/mcp"
+# (connect, read): fail fast when Producer Pal is not listening
+_TIMEOUT = (2.0, 30.0)
+_HR = "=" * 60
 payload = {
     "jsonrpc": "2.0",
     "method": "tools/call",
     "params": {"name": "ppal-read-live-set", "arguments": {}},
     "id": 1
 }
-headers = {
-    "Content-Type": "application/json",
-    "Accept": "application/json, text/event-stream"
-}
+# Fixed request: serialize once at import, POST the bytes as-is
+_READ_LIVE_SET_BODY = dumps(payload)
+
+def parse_sse(body):
+    """Layer 1: Parse SSE, returning the first data frame.
+
+    One C-level find jumps straight to the payload instead of splitting
+    the body into lines and testing each one. The field must start a line,
+    so "data: " inside a comment or another field is skipped.
+    """
+    if body.startswith(b'data: '):
+        i = 6
+    else:
+        i = body.find(b'\ndata: ')
+        if i == -1:
+            raise ValueError("No data in SSE")
+        i += 7
+    j = body.find(b'\n', i)
+    return loads(body[i:j] if j != -1 else body[i:])
+
+WHITESPACE = frozenset(b' \t\r\n')
+QUOTE, BACKSLASH = ord('"'), ord('\\')
+# Identifier followed by ':'; must start with a letter or '_', so array
+# contents like 123: are never mistaken for keys
+_KEY_RE = re.compile(rb'([A-Za-z_]\w*)\s*:')
 
-def parse_sse(sse_text):
-    """Layer 1: Parse SSE."""
-    lines = sse_text.strip().split('\n')
-    for line in lines:
-        if line.startswith('data: '):
-            return json.loads(line[6:])
-    raise ValueError("No data in SSE")
 
 def parse_js_object(js_text):
     """Layer 3: Parse JavaScript object notation."""
-    # Add quotes to unquoted keys
-    json_text = re.sub(r'(\w+):', r'"\1":', js_text)
-    return json.loads(json_text)
+    # Fast path: the text is already valid JSON, no rewrite needed
+    try:
+        return loads(js_text)
+    except ValueError:  # json and orjson decode errors both subclass it
+        return loads(quote_js_keys(js_text))
+
+
+def quote_js_keys(js_text):
+    """Quote unquoted object keys, returning JSON as UTF-8 bytes.
+
+    Single left-to-right scan that tracks string-literal state and quotes
+    only identifiers in object-key position (after '{' or ',', before ':'),
+    so text inside string values such as "note:C3" is never rewritten.
+    Verbatim runs are copied as slices into one bytearray.
+    """
+    src = js_text.encode('utf-8')
+    buf = bytearray()
+    n = len(src)
+    i = 0
+    run = 0              # start of the pending verbatim run
+    in_string = False
+    expect_key = False   # last significant byte was '{' or ','
+
+    while i < n:
+        c = src[i]
+        if in_string:
+            if c == BACKSLASH:
+                i += 2   # skip the escaped byte
+                continue
+            if c == QUOTE:
+                in_string = False
+        elif c == QUOTE:
+            in_string = True
+            expect_key = False
+        elif c == 0x7B or c == 0x2C:   # '{' or ','
+            expect_key = True
+        elif expect_key and (m := _KEY_RE.match(src, i)):
+            j = m.end(1)
+            buf += src[run:i]
+            buf += b'"' + src[i:j] + b'"'
+            run = j
+            expect_key = False
+            i = j
+            continue
+        elif c not in WHITESPACE:
+            expect_key = False
+        i += 1
+
+    buf += src[run:]
+    return bytes(buf)
 
-print("=" * 60)
+print(_HR)
 print("FULL PIPELINE TEST")
-print("=" * 60)
+print(_HR)
 
 try:
-    response = requests.post(url, json=payload, headers=headers, timeout=30)
+    response = SESSION.post(url, data=_READ_LIVE_SET_BODY, timeout=_TIMEOUT, stream=True)
+    body = read_body(response)
     response.raise_for_status()
     
     # Layer 1: SSE
     print("\n[Layer 1] Parsing SSE...")
-    json_rpc = parse_sse(response.text)
+    json_rpc = parse_sse(body)
     print(f"  ✓ JSON-RPC keys: {list(json_rpc.keys())}")
     
     # Layer 2: MCP content
@@ -79,11 +145,10 @@ try:
                 print(f"  Type: {track.get('type')}")
                 print(f"  Index: {track.get('trackIndex')}")
     
-    print("\n" + "=" * 60)
+    print("\n" + _HR)
     print("✓ ALL LAYERS PARSED SUCCESSFULLY!")
-    print("=" * 60)
+    print(_HR)
     
 except Exception as e:
     print(f"\n✗ Error: {e}")
-    import traceback
     traceback.print_exc()
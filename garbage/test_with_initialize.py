@@ -1,16 +1,14 @@
 """Test Producer Pal with initialize handshake first."""
 
-import requests
-import json
+import traceback
 
-url = "http://localhost:3350/mcp"
+from mcp_session import SESSION, dumps, loads, pretty
 
-print("=" * 60)
-print("TEST: Producer Pal with initialize handshake")
-print("=" * 60)
+url = "http://localhost:3350/mcp"
+# (connect, read): fail fast when Producer Pal is not listening
+_TIMEOUT = (2.0, 10.0)
+_HR = "=" * 60
 
-# Step 1: Initialize
-print("\n[1] Sending initialize...")
 init_payload = {
     "jsonrpc": "2.0",
     "method": "initialize",
@@ -25,25 +23,6 @@ init_payload = {
     "id": 1
 }
 
-try:
-    response = requests.post(url, json=init_payload, timeout=10)
-    print(f"  Status: {response.status_code}")
-    print(f"  Response: {response.text[:200]}")
-    
-    if response.status_code == 200 and response.text:
-        init_result = response.json()
-        print("  ✓ Initialize successful")
-        print(f"  Server info: {init_result.get('result', {})}")
-    else:
-        print("  ✗ Initialize failed or empty")
-        
-except Exception as e:
-    print(f"  ✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
-
-# Step 2: Call tool
-print("\n[2] Sending tools/call (ppal-read-live-set)...")
 tool_payload = {
     "jsonrpc": "2.0",
     "method": "tools/call",
@@ -54,21 +33,98 @@ tool_payload = {
     "id": 2
 }
 
+
+def parse_messages(response):
+    """Decode a JSON or SSE response into a flat list of JSON-RPC messages."""
+    if response.headers.get('Content-Type', '').startswith('text/event-stream'):
+        frames = [
+            loads(line[6:])
+            for line in response.content.split(b'\n')
+            if line.startswith(b'data: ')
+        ]
+    else:
+        frames = [loads(response.content)]
+
+    messages = []
+    for frame in frames:
+        # A batch reply is an array; a single reply is one object
+        messages.extend(frame if isinstance(frame, list) else [frame])
+    return messages
+
+
+def report_initialize(init_result):
+    print("  ✓ Initialize successful")
+    print(f"  Server info: {init_result.get('result', {})}")
+
+
+def report_tool_call(result):
+    print("  ✓ Tool call successful")
+    print(f"  Result: {pretty(result, limit=500)}")
+
+
+print(_HR)
+print("TEST: Producer Pal with initialize handshake")
+print(_HR)
+
+# Step 1: initialize + tools/call in one JSON-RPC batch (one round trip)
+print("\n[1] Sending initialize + tools/call (ppal-read-live-set) as one batch...")
+by_id = {}
+
 try:
-    response = requests.post(url, json=tool_payload, timeout=10)
+    response = SESSION.post(url, data=dumps([init_payload, tool_payload]), timeout=_TIMEOUT)
     print(f"  Status: {response.status_code}")
-    print(f"  Response length: {len(response.text)} chars")
-    
-    if response.text:
-        result = response.json()
-        print("  ✓ Tool call successful")
-        print(f"  Result: {json.dumps(result, indent=2)[:500]}")
-    else:
-        print("  ✗ Empty response")
-        
+    print(f"  Response: {response.content[:200].decode('utf-8', 'replace')}")
+
+    if response.status_code == 200 and response.content:
+        by_id = {
+            message.get('id'): message
+            for message in parse_messages(response)
+            if isinstance(message, dict)
+        }
+
 except Exception as e:
     print(f"  ✗ Error: {e}")
-    import traceback
     traceback.print_exc()
 
-print("\n" + "=" * 60)
+if 1 in by_id and 2 in by_id:
+    report_initialize(by_id[1])
+    print("\n[2] tools/call answered in the same batch")
+    report_tool_call(by_id[2])
+else:
+    # Server rejected the batch (MCP forbids batching initialize in newer
+    # revisions): fall back to two requests on the same keep-alive socket
+    print("  ⚠ Batch not supported, falling back to sequential requests")
+
+    try:
+        response = SESSION.post(url, data=dumps(init_payload), timeout=_TIMEOUT)
+        print(f"  Status: {response.status_code}")
+        print(f"  Response: {response.content[:200].decode('utf-8', 'replace')}")
+
+        if response.status_code == 200 and response.content:
+            report_initialize(parse_messages(response)[0])
+        else:
+            print("  ✗ Initialize failed or empty")
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        traceback.print_exc()
+
+    # Step 2: Call tool
+    print("\n[2] Sending tools/call (ppal-read-live-set)...")
+
+    try:
+        # Same SESSION: reuses the keep-alive socket opened by initialize
+        response = SESSION.post(url, data=dumps(tool_payload), timeout=_TIMEOUT)
+        print(f"  Status: {response.status_code}")
+        print(f"  Response length: {len(response.content)} bytes")
+
+        if response.content:
+            report_tool_call(parse_messages(response)[0])
+        else:
+            print("  ✗ Empty response")
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        traceback.print_exc()
+
+print("\n" + _HR)